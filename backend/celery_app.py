@@ -1,5 +1,2 @@
-from celery import Celery
-import os
-
-redis_url = os.getenv('REDIS_URL')
-celery_app = Celery('tasks', broker=redis_url, backend=redis_url)
+# Re-export the configured app so there is a single Celery instance (and broker pool)
+from .tasks import celery_app
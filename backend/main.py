@@ -1,21 +1,22 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, WebSocket, WebSocketDisconnect
 import pandas as pd
 import aiofiles
 import os
+import asyncio
+import orjson
 from celery.result import AsyncResult
-from .tasks import validate_bulk_emails, celery_app, validate_email
-from fastapi.responses import JSONResponse
-from .utils import email_validator, EmailValidator
+from .tasks import validate_bulk_emails, celery_app, validate_email, results_path
+from fastapi.responses import ORJSONResponse, FileResponse
+from .utils import email_validator
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 import time
-from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict
+from functools import lru_cache
 import logging
-from celery import Celery
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import tempfile
 from pydantic import BaseModel
-import shutil
 
 # Configure logging
 logging.basicConfig(
@@ -31,7 +32,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Email Validation API",
     description="API for validating email addresses and checking for disposable domains",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -47,55 +49,76 @@ app.add_middleware(
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-# Use the celery_app from tasks.py instead of creating a new instance
-celery = celery_app
-
-# Configure Celery
-celery.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
-    timezone='UTC',
-    enable_utc=True,
-    task_default_queue='celery',
-    task_namespace='backend.tasks',
-    task_track_started=True,
-    task_time_limit=3600,  # 1 hour timeout
-    worker_prefetch_multiplier=1,  # Prevent worker from prefetching too many tasks
-    task_acks_late=True,  # Only acknowledge tasks after they're completed
-    task_reject_on_worker_lost=True  # Requeue tasks if worker dies
-)
+# Bytes read per chunk when saving uploads
+UPLOAD_CHUNK_SIZE = 1 << 20
 
 # Simple rate limiting
 class RateLimiter:
+    """Token bucket per client IP, refilled at calls_limit per time_window."""
+
+    # Requests between sweeps of idle client buckets
+    PRUNE_INTERVAL = 1000
+
     def __init__(self, calls_limit: int = 100, time_window: int = 60):
         self.calls_limit = calls_limit
         self.time_window = time_window
-        self.calls = defaultdict(list)
+        self.refill_rate = calls_limit / time_window
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+        self.requests_seen = 0
 
     def is_rate_limited(self, client_ip: str) -> bool:
-        now = datetime.now()
-        window_start = now - timedelta(seconds=self.time_window)
+        now = time.monotonic()
 
-        # Remove old requests
-        self.calls[client_ip] = [t for t in self.calls[client_ip] if t > window_start]
+        self.requests_seen += 1
+        if self.requests_seen % self.PRUNE_INTERVAL == 0:
+            self._prune(now)
+
+        # Refill tokens for the time elapsed since this client's last request
+        tokens, last_seen = self.buckets.get(client_ip, (self.calls_limit, now))
+        tokens = min(self.calls_limit, tokens + (now - last_seen) * self.refill_rate)
 
         # Check if the client exceeded the limit
-        if len(self.calls[client_ip]) >= self.calls_limit:
+        if tokens < 1:
+            self.buckets[client_ip] = (tokens, now)
             return True
-        
-        # Add this request to history *only if allowed*
-        self.calls[client_ip].append(now)
+
+        # Spend a token *only if allowed*
+        self.buckets[client_ip] = (tokens - 1, now)
         return False
 
+    def _prune(self, now: float) -> None:
+        """Drop clients idle long enough that their bucket would be full again."""
+        cutoff = now - 2 * self.time_window
+        self.buckets = {
+            ip: bucket for ip, bucket in self.buckets.items() if bucket[1] > cutoff
+        }
+
 rate_limiter = RateLimiter()
 
+# Seconds a worker inspection result is reused by /health
+HEALTH_CACHE_SECONDS = 5
+
+@lru_cache(maxsize=1)
+def inspect_workers_active(time_bucket: int) -> bool:
+    """Broadcast a worker inspection at most once per time bucket."""
+    return bool(celery_app.control.inspect(timeout=0.5).active())
+
+# Terminal task responses by task id, oldest first
+MAX_TERMINAL_RESULTS = 256
+terminal_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def cache_terminal_result(task_id: str, response: Dict[str, Any]) -> None:
+    """Remember the response for a finished task, evicting the oldest entry."""
+    terminal_results[task_id] = response
+    if len(terminal_results) > MAX_TERMINAL_RESULTS:
+        terminal_results.popitem(last=False)
+
 # Add rate limiting middleware
 @app.middleware("http")
 async def rate_limit_middleware(request, call_next):
     client_ip = request.client.host
     if rate_limiter.is_rate_limited(client_ip):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=429,
             content={"error": "Too many requests. Please try again later."}
         )
@@ -106,7 +129,7 @@ async def rate_limit_middleware(request, call_next):
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     logger.error(f"Global error handler caught: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -121,6 +144,8 @@ async def root():
         "endpoints": {
             "upload": "/upload/ - Upload CSV file with emails for bulk validation",
             "results": "/results/{task_id} - Get validation results for a task",
+            "results_ws": "/ws/results/{task_id} - WebSocket pushing status updates for a task",
+            "results_file": "/results-file/{task_id} - Download per-email results of a completed task",
             "validate_single": "/validate-single/ - Validate a single email address"
         }
     }
@@ -131,7 +156,7 @@ class EmailData(BaseModel):
 @app.post("/validate/")
 async def validate_single_email(email_data: EmailData):
     try:
-        result = validate_email(email_data.email)
+        result = await run_in_threadpool(validate_email, email_data.email)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -142,9 +167,10 @@ async def upload_file(file: UploadFile = File(...)):
         # Create a temporary file in the uploads directory with unique name
         temp_file_path = os.path.join(UPLOAD_DIR, f"temp_{int(time.time())}_{file.filename}")
         
-        # Save the uploaded file
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Stream the upload to disk without blocking the event loop
+        async with aiofiles.open(temp_file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
         
         # Start the validation task
         task = validate_bulk_emails.delay(temp_file_path)
@@ -158,72 +184,89 @@ async def upload_file(file: UploadFile = File(...)):
         logger.error(f"Error in upload_file: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/results/{task_id}")
-async def get_results(task_id: str):
-    try:
-        task_result = AsyncResult(task_id)
+async def task_status(task_id: str) -> Dict[str, Any]:
+    """Build the status payload for a bulk validation task."""
+    # Finished tasks never change, so answer repeat polls from memory
+    cached = terminal_results.get(task_id)
+    if cached is not None:
+        return cached
 
-        if task_result is None:
-            return {
-                "status": "failed",
-                "error": "Task not found",
-                "state": "NOT_FOUND"
-            }
-        
-        # Handle task failure
-        if task_result.state == "FAILURE":
+    task_result = AsyncResult(task_id, app=celery_app)
+
+    if task_result is None:
+        return {
+            "status": "failed",
+            "error": "Task not found",
+            "state": "NOT_FOUND"
+        }
+    
+    # Read the state once, off the event loop; every access goes to the result backend
+    state = await run_in_threadpool(lambda: task_result.state)
+
+    # Handle task failure
+    if state == "FAILURE":
+        response = {
+            "status": "failed",
+            "error": str(task_result.result),
+            "state": "FAILURE"
+        }
+        cache_terminal_result(task_id, response)
+        return response
+    
+    # Handle task success
+    if state == "SUCCESS":
+        # The meta is cached once the task is ready, so this does not block
+        result = task_result.result
+        if result is None:
             return {
                 "status": "failed",
-                "error": str(task_result.result),
-                "state": "FAILURE"
-            }
-        
-        # Handle task success
-        if task_result.state == "SUCCESS":
-            result = task_result.get()
-            if result is None:
-                return {
-                    "status": "failed",
-                    "error": "Task result is empty",
-                    "state": "SUCCESS"
-                }
-            return {
-                **result,
+                "error": "Task result is empty",
                 "state": "SUCCESS"
             }
+        response = {
+            **result,
+            "state": "SUCCESS"
+        }
+        cache_terminal_result(task_id, response)
+        return response
 
-        # Task is still in queue
-        if task_result.state == "PENDING":
-            return {
-                "status": "waiting",
-                "message": "Task is still in queue. Try again later.",
-                "state": "PENDING"
-            }
-
-        # Task has started processing
-        if task_result.state == "STARTED":
-            return {
-                "status": "processing",
-                "message": "Task is in progress",
-                "state": "STARTED"
-            }
+    # Task is still in queue
+    if state == "PENDING":
+        return {
+            "status": "waiting",
+            "message": "Task is still in queue. Try again later.",
+            "state": "PENDING"
+        }
 
-        # Task is in progress with progress info
-        if task_result.info:
-            return {
-                "status": "processing",
-                "current": task_result.info.get("current", 0),
-                "total": task_result.info.get("total", 0),
-                "state": task_result.state
-            }
-        
-        # Default processing state
+    # Task has started processing
+    if state == "STARTED":
         return {
             "status": "processing",
             "message": "Task is in progress",
-            "state": task_result.state
+            "state": "STARTED"
+        }
+
+    # Task is in progress with progress info
+    info = await run_in_threadpool(lambda: task_result.info)
+    if info:
+        return {
+            "status": "processing",
+            "current": info.get("current", 0),
+            "total": info.get("total", 0),
+            "state": state
         }
+    
+    # Default processing state
+    return {
+        "status": "processing",
+        "message": "Task is in progress",
+        "state": state
+    }
 
+@app.get("/results/{task_id}")
+async def get_results(task_id: str):
+    try:
+        return await task_status(task_id)
     except Exception as e:
         logger.error(f"Error in get_results: {str(e)}")
         return {
@@ -232,6 +275,74 @@ async def get_results(task_id: str):
             "state": "ERROR"
         }
 
+# Seconds between result backend reads for a WebSocket subscriber, growing
+# from the initial delay to the maximum while the task runs
+WS_POLL_INITIAL_DELAY = 0.1
+WS_POLL_BACKOFF = 1.4
+WS_POLL_MAX_DELAY = 2.0
+
+# Longest a WebSocket subscription stays open; no task outlives task_time_limit
+WS_MAX_LIFETIME = 3600
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Discard client frames until the client goes away."""
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+@app.websocket("/ws/results/{task_id}")
+async def results_websocket(websocket: WebSocket, task_id: str):
+    """
+    Push status updates for a bulk validation task until it finishes.
+
+    Each frame is the /results/{task_id} payload, sent only when it changes,
+    so clients hear about a state change without polling over HTTP. The
+    subscription ends when the client disconnects or after WS_MAX_LIFETIME.
+    """
+    await websocket.accept()
+    deadline = time.monotonic() + WS_MAX_LIFETIME
+    last_sent = None
+    delay = WS_POLL_INITIAL_DELAY
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            try:
+                response = await task_status(task_id)
+            except Exception as e:
+                logger.error(f"Error in results_websocket: {str(e)}")
+                response = {
+                    "status": "failed",
+                    "error": f"Error getting results: {str(e)}",
+                    "state": "ERROR"
+                }
+            if response != last_sent:
+                await websocket.send_text(orjson.dumps(response).decode())
+                last_sent = response
+            if response["status"] in ("completed", "failed"):
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Sleep between reads, but wake up as soon as the client leaves
+            await asyncio.wait((disconnected,), timeout=min(delay, remaining))
+            if disconnected.done():
+                return
+            delay = min(delay * WS_POLL_BACKOFF, WS_POLL_MAX_DELAY)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+
+@app.get("/results-file/{task_id}")
+async def get_results_file(task_id: str):
+    """
+    Download the per-email results of a completed bulk validation task.
+    """
+    file_path = results_path(os.path.basename(task_id))
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="Results not found")
+    return FileResponse(file_path, media_type="application/json")
+
 @app.post("/validate-single/")
 async def validate_single_email(email: str = Form(...)):
     """
@@ -239,8 +350,7 @@ async def validate_single_email(email: str = Form(...)):
     """
     try:
         logger.info(f"Validating single email: {email}")
-        validator = EmailValidator()
-        result = validator.validate_email(email)
+        result = await run_in_threadpool(email_validator.validate_email, email)
         return result
     except Exception as e:
         logger.error(f"Error validating single email: {str(e)}")
@@ -252,7 +362,11 @@ async def health_check():
     Health check endpoint to verify the API is running.
     """
     try:
-        celery_status = "running" if celery_app.control.inspect().active() else "not running"
+        # The broadcast blocks for up to its timeout, so keep it off the event loop
+        workers_active = await run_in_threadpool(
+            inspect_workers_active, int(time.time()) // HEALTH_CACHE_SECONDS
+        )
+        celery_status = "running" if workers_active else "not running"
         return {
             "status": "healthy",
             "services": {
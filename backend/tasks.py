@@ -1,26 +1,41 @@
-from celery import Celery
-from .utils import EmailValidator
-import pandas as pd
+from celery import Celery, chord
+from celery.exceptions import Ignore
+from celery.utils import uuid
+from kombu import Exchange, Queue
+from kombu.serialization import register
+from .utils import EmailValidator, email_validator, resolve_domains
+import csv
+import orjson
 import time
 import logging
 import os
-from email_validator import validate_email as validate_email_lib, EmailNotValidError
-import dns.resolver
-import re
-from typing import Dict, Any, List
+import threading
+from cachetools import TTLCache
+from itertools import chain, islice
+from typing import Dict, Any, List, Optional, Iterable
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize Celery with Redis URL from environment variable
-celery_app = Celery('tasks', broker=os.getenv('REDIS_URL'), backend=os.getenv('REDIS_URL'))
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+celery_app = Celery('tasks', broker=REDIS_URL, backend=REDIS_URL)
+
+# orjson encodes the large result payloads several times faster than stdlib json
+register(
+    'orjson',
+    orjson.dumps,
+    orjson.loads,
+    content_type='application/x-orjson',
+    content_encoding='utf-8'
+)
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='orjson',
+    accept_content=['orjson', 'json'],
+    result_serializer='orjson',
     timezone='UTC',
     enable_utc=True,
     task_default_queue='celery',
@@ -29,14 +44,245 @@ celery_app.conf.update(
     task_time_limit=3600,  # 1 hour timeout
     worker_prefetch_multiplier=1,  # Prevent worker from prefetching too many tasks
     task_acks_late=True,  # Only acknowledge tasks after they're completed
-    task_reject_on_worker_lost=True  # Requeue tasks if worker dies
+    task_reject_on_worker_lost=True,  # Requeue tasks if worker dies
+    worker_max_tasks_per_child=1000,  # Recycle children so DNS/validation caches stay bounded
+    worker_max_memory_per_child=500_000,  # KiB
+    task_compression='gzip',
+    result_compression='gzip',  # Bulk results are large, repetitive JSON
+    task_queues=(
+        Queue('celery', routing_key='celery'),
+        # Chunk messages are cheap to regenerate, so skip persisting them
+        Queue('bulk', Exchange('bulk', delivery_mode=1), routing_key='bulk', durable=False),
+    ),
+    task_routes={
+        'backend.tasks.validate_chunk': {'queue': 'bulk', 'delivery_mode': 'transient'},
+    },
+    worker_send_task_events=False,  # No event consumers, skip publishing events
+    task_send_sent_event=False,
+    broker_pool_limit=50,  # Reuse a bounded set of broker connections
+    broker_connection_retry_on_startup=True,
+    broker_transport_options={
+        'visibility_timeout': 3600,  # Match task_time_limit
+        'socket_keepalive': True
+    },
+    result_backend_transport_options={
+        'retry_policy': {'timeout': 5.0},
+        'socket_keepalive': True
+    },
+    result_expires=86400,  # Seconds; result files in RESULTS_DIR expire with them
 )
 
-# [Keep all the existing validation functions: check_disposable_domain, check_role_based_email, etc.]
+# Number of validated emails between progress updates
+PROGRESS_INTERVAL = 100
+
+# Minimum seconds between progress writes to the result backend
+PROGRESS_MIN_SECONDS = 1.0
+
+# Per-email results of finished bulk tasks, shared with the API
+RESULTS_DIR = "results"
+os.makedirs(RESULTS_DIR, exist_ok=True)
+
+# Distinct addresses memoized by validate_email in the API process
+VALIDATION_CACHE_SIZE = 200000
+
+# Seconds a memoized verdict is reused before the address is checked again
+VALIDATION_CACHE_TTL = 3600
+
+# Uploads up to this many emails are validated inline; dispatching
+# subtasks costs more than it saves below it
+BULK_INLINE_LIMIT = 5000
+
+# Emails per validate_chunk subtask when a bulk upload is fanned out
+BULK_CHUNK_SIZE = 1000
+
+
+_validation_cache = TTLCache(maxsize=VALIDATION_CACHE_SIZE, ttl=VALIDATION_CACHE_TTL)
+_validation_cache_lock = threading.Lock()
+
+
+def _validate_normalized_email(email: str) -> Dict[str, Any]:
+    """Validate an already normalized address, reusing a recent valid verdict."""
+    with _validation_cache_lock:
+        cached = _validation_cache.get(email)
+    if cached is not None:
+        return cached
+    result = email_validator.validate_email(email)
+    # A failed DNS check may be a transient lookup error, and definitive
+    # negative answers are already cached by the resolver, so only valid
+    # verdicts are kept here
+    if result['is_valid']:
+        with _validation_cache_lock:
+            _validation_cache[email] = result
+    return result
+
+
+def validate_email(email: str, mx_cache: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+    """
+    Validate a single email address, reusing pre-resolved MX records if given.
+
+    Without an mx_cache, valid results are memoized by the stripped,
+    lower-cased address for VALIDATION_CACHE_TTL seconds. The only such
+    caller is the /validate/ endpoint, so the cache lives in the API process.
+    """
+    if mx_cache is not None:
+        return email_validator.validate_email(email, mx_cache=mx_cache)
+    result = _validate_normalized_email(email.strip().lower())
+    return {**result, 'email': email}
+
+
+def validate_emails(emails: List[str], on_progress=None) -> List[Dict[str, Any]]:
+    """Validate a list of emails, preserving input order."""
+    # Validate each distinct address once; duplicates differ at most in case
+    keys = [email.strip().lower() for email in emails]
+    unique_emails = list(dict.fromkeys(keys))
+
+    # Resolve each unique domain once instead of once per email
+    mail_routes = resolve_domains(email_validator.dns_candidate_domains(unique_emails))
+
+    validated = {}
+    for start in range(0, len(unique_emails), PROGRESS_INTERVAL):
+        batch = unique_emails[start:start + PROGRESS_INTERVAL]
+        batch_results = email_validator.validate_batch(batch, mx_cache=mail_routes)
+        validated.update(zip(batch, batch_results))
+        if on_progress is not None:
+            on_progress(len(validated), len(unique_emails))
+
+    return [{**validated[key], 'email': email} for key, email in zip(keys, emails)]
+
+
+def results_path(task_id: str) -> str:
+    """Path of the stored per-email results for a bulk task."""
+    return os.path.join(RESULTS_DIR, f"{task_id}.json")
+
+
+def _chunk_path(task_id: str) -> str:
+    """Path of the results written by one validate_chunk task."""
+    return os.path.join(RESULTS_DIR, f"{task_id}.part.json")
+
+
+def _write_chunk(path: str, chunk: List[Dict[str, Any]]) -> None:
+    """Store one chunk of per-email results as a JSON array."""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(chunk))
+
+
+def _read_chunks(paths: Iterable[str]) -> Iterable[List[Dict[str, Any]]]:
+    """Load chunk files written by validate_chunk one at a time, removing each after use."""
+    for path in paths:
+        with open(path, 'rb') as f:
+            chunk = orjson.loads(f.read())
+        _remove_file(path)
+        yield chunk
+
+
+def _remove_expired_results() -> None:
+    """Delete files in RESULTS_DIR older than the task results that point to them."""
+    cutoff = time.time() - celery_app.conf.result_expires
+    for entry in os.scandir(RESULTS_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                _remove_file(entry.path)
+        except OSError:
+            continue
+
+
+def summarize_results(
+    task_id: str,
+    chunk_results: Iterable[List[Dict[str, Any]]],
+    processing_time: float
+) -> Dict[str, Any]:
+    """
+    Build the bulk task payload from per-email results, given in chunks.
+
+    The results are streamed chunk by chunk into one JSON array in RESULTS_DIR
+    and referenced by URL, so the result backend only stores the summary.
+    The array is written under a temporary name and moved into place, so
+    /results-file never serves a partly written file.
+    """
+    _remove_expired_results()
+    total_count = 0
+    valid_count = 0
+    path = results_path(task_id)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b'[')
+        for chunk in chunk_results:
+            if not chunk:
+                continue
+            if total_count:
+                f.write(b',')
+            # Strip the array brackets so chunks concatenate into one array
+            f.write(orjson.dumps(chunk)[1:-1])
+            total_count += len(chunk)
+            valid_count += sum(1 for result in chunk if result['is_valid'])
+        f.write(b']')
+    os.replace(tmp_path, path)
+
+    return {
+        "status": "completed",
+        "valid_count": valid_count,
+        "invalid_count": total_count - valid_count,
+        "total_count": total_count,
+        "processing_time": processing_time,
+        "results_url": f"/results-file/{task_id}",
+        "state": "SUCCESS"
+    }
+
+
+def _chunked(items: Iterable[str], size: int) -> List[List[str]]:
+    """Group an iterable into lists of at most size items."""
+    iterator = iter(items)
+    chunks = []
+    while chunk := list(islice(iterator, size)):
+        chunks.append(chunk)
+    return chunks
+
+
+def _remove_file(file_path: str) -> None:
+    """Remove an uploaded file, logging instead of raising on failure."""
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+    except Exception as e:
+        logger.warning(f"Failed to clean up temporary file {file_path}: {str(e)}")
+
+
+@celery_app.task(name='backend.tasks.validate_chunk', bind=True)
+def validate_chunk(self, emails: List[str]) -> str:
+    """
+    Validate one slice of a bulk upload.
+
+    The rows are written to RESULTS_DIR and only their path goes through the
+    result backend, so Redis never holds the per-email results.
+    """
+    path = _chunk_path(self.request.id)
+    _write_chunk(path, validate_emails(emails))
+    return path
+
+
+@celery_app.task(name='backend.tasks.remove_chunk_files')
+def remove_chunk_files(paths: List[str]) -> None:
+    """Delete the chunk files of a bulk task whose chord failed."""
+    for path in paths:
+        _remove_file(path)
+
+
+@celery_app.task(name='backend.tasks.aggregate_results', bind=True)
+def aggregate_results(self, chunk_paths: List[str], start_time: float) -> Dict[str, Any]:
+    """Merge chunk result files back into a single bulk task payload."""
+    # As the replacing chord's body, this task runs under the bulk task's id
+    return summarize_results(self.request.id, _read_chunks(chunk_paths), time.time() - start_time)
+
 
 @celery_app.task(name='backend.tasks.validate_bulk_emails', bind=True)
 def validate_bulk_emails(self, file_path: str) -> Dict[str, Any]:
-    """Validate multiple email addresses from a file."""
+    """
+    Validate multiple email addresses from a file.
+
+    Uploads larger than BULK_INLINE_LIMIT are fanned out as a chord of
+    validate_chunk tasks; the chord replaces this task, so its result is
+    still available under the original task id.
+    """
     try:
         # Ensure file exists
         if not os.path.exists(file_path):
@@ -49,83 +295,84 @@ def validate_bulk_emails(self, file_path: str) -> Dict[str, Any]:
         # Read the file
         try:
             if file_path.endswith('.csv'):
-                df = pd.read_csv(file_path)
-                if 'email' not in df.columns:
-                    return {
-                        "status": "failed",
-                        "error": "CSV file must contain an 'email' column",
-                        "state": "FAILURE"
-                    }
-                emails = df['email'].tolist()
+                # The csv module streams rows; a DataFrame is overkill for one column.
+                # utf-8-sig drops the BOM Excel writes, which would hide the header
+                with open(file_path, newline='', encoding='utf-8-sig') as f:
+                    reader = csv.DictReader(f)
+                    if 'email' not in (reader.fieldnames or []):
+                        return {
+                            "status": "failed",
+                            "error": "CSV file must contain an 'email' column",
+                            "state": "FAILURE"
+                        }
+                    emails = (
+                        row['email'].strip() for row in reader
+                        if row.get('email') and row['email'].strip()
+                    )
+                    chunks = _chunked(emails, BULK_CHUNK_SIZE)
             else:
-                with open(file_path, 'r') as f:
-                    emails = [line.strip() for line in f if line.strip()]
+                with open(file_path, 'r', encoding='utf-8-sig') as f:
+                    emails = (line.strip() for line in f if line.strip())
+                    chunks = _chunked(emails, BULK_CHUNK_SIZE)
         except Exception as e:
             return {
                 "status": "failed",
                 "error": f"Error reading file: {str(e)}",
                 "state": "FAILURE"
             }
+        finally:
+            # The emails are in memory now, so the upload is no longer needed
+            _remove_file(file_path)
         
-        if not emails:
+        if not chunks:
             return {
                 "status": "failed",
                 "error": "No email addresses found in the file",
                 "state": "FAILURE"
             }
         
-        total_emails = len(emails)
-        valid_count = 0
-        invalid_count = 0
-        results = []
         start_time = time.time()
-        
-        for i, email in enumerate(emails):
-            # Update progress using self instead of task name
+
+        if sum(len(chunk) for chunk in chunks) > BULK_INLINE_LIMIT:
+            # Chunk ids are fixed up front so a failed chord can remove
+            # the files its successful chunks already wrote
+            chunk_ids = [uuid() for _ in chunks]
+            return self.replace(chord(
+                [
+                    validate_chunk.s(chunk).set(task_id=chunk_id)
+                    for chunk, chunk_id in zip(chunks, chunk_ids)
+                ],
+                aggregate_results.s(start_time)
+            ).on_error(remove_chunk_files.si([_chunk_path(chunk_id) for chunk_id in chunk_ids])))
+
+        last_report = time.monotonic()
+
+        def report_progress(done: int, total: int) -> None:
+            # Each update is a result backend write; the final one would be
+            # overwritten by the result a moment later anyway
+            nonlocal last_report
+            now = time.monotonic()
+            if done >= total or now - last_report < PROGRESS_MIN_SECONDS:
+                return
+            last_report = now
             self.update_state(
                 state='PROGRESS',
                 meta={
-                    'current': i,
-                    'total': total_emails,
+                    'current': done,
+                    'total': total,
                     'status': 'processing'
                 }
             )
-            
-            # Validate email
-            result = validate_email(email)
-            results.append(result)
-            
-            if result['is_valid']:
-                valid_count += 1
-            else:
-                invalid_count += 1
-        
-        processing_time = time.time() - start_time
-        
-        # Clean up the temporary file
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as e:
-            logger.warning(f"Failed to clean up temporary file {file_path}: {str(e)}")
-        
-        return {
-            "status": "completed",
-            "valid_count": valid_count,
-            "invalid_count": invalid_count,
-            "total_count": total_emails,
-            "processing_time": processing_time,
-            "results": results,
-            "state": "SUCCESS"
-        }
+
+        results = validate_emails(list(chain.from_iterable(chunks)), on_progress=report_progress)
+        return summarize_results(self.request.id, [results], time.time() - start_time)
+    except Ignore:
+        # Raised by self.replace() once the chord has been scheduled
+        raise
     except Exception as e:
         logger.error(f"Error in validate_bulk_emails: {str(e)}")
         # Clean up the temporary file even if there's an error
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as cleanup_error:
-            logger.warning(f"Failed to clean up temporary file {file_path}: {str(cleanup_error)}")
+        _remove_file(file_path)
         
         return {
             "status": "failed",
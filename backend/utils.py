@@ -4,14 +4,16 @@ import aiofiles
 import os
 from celery.result import AsyncResult
 from fastapi.responses import JSONResponse
-from typing import List, Set, Dict, Any
+from typing import List, Set, Dict, Any, Optional, Iterable
 import tldextract
-from email_validator import validate_email, EmailNotValidError
 import re
-import dns.resolver
+import asyncio
+import aiodns
 import socket
 from datetime import datetime
 import logging
+import threading
+from cachetools import TLRUCache
 
 app = FastAPI()
 
@@ -20,314 +22,485 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 logger = logging.getLogger(__name__)
 
+# Common typo patterns in email addresses
+_TYPO_PATTERNS = {
+    'gmail.com': ['gamil.com', 'gmal.com', 'gmial.com', 'gmaill.com'],
+    'yahoo.com': ['yaho.com', 'yhaoo.com', 'yahooo.com'],
+    'hotmail.com': ['hotmal.com', 'hotmai.com', 'hotmial.com', 'hotmaill.com'],
+    'outlook.com': ['outlok.com', 'outlock.com'],
+    'icloud.com': ['icloud.com'],
+    'protonmail.com': ['protonmal.com', 'protonmai.com', 'protonmial.com'],
+    'aol.com': ['aol.com'],
+    'live.com': ['live.com'],
+    'me.com': ['me.com'],
+    'mac.com': ['mac.com']
+}
+
+# Common disposable email domains
+_DISPOSABLE_DOMAINS = frozenset({
+    'tempmail.com', 'tempmail.net', 'tempmail.org',
+    'throwawaymail.com', 'throwawaymail.net',
+    'mailinator.com', 'mailinator.net',
+    'tempmailaddress.com', 'tempmail.plus',
+    'tempmail.ninja', 'tempmail.xyz',
+    'tempmail.ws', 'tempmail.us',
+    'tempmail.co.uk', 'tempmail.de',
+    'tempmail.fr', 'tempmail.it',
+    'tempmail.es', 'tempmail.ru',
+    'tempmail.jp', 'tempmail.cn',
+    'tempmail.in', 'tempmail.com.br',
+    'tempmail.com.au', 'tempmail.co.nz',
+    'tempmail.co.za', 'tempmail.ae',
+    'tempmail.sg', 'tempmail.hk',
+    'tempmail.tw', 'tempmail.kr',
+    'tempmail.vn', 'tempmail.th',
+    'tempmail.id', 'tempmail.my',
+    'tempmail.ph', 'tempmail.pk',
+    'tempmail.bd', 'tempmail.lk',
+    'tempmail.mm', 'tempmail.kh',
+    'tempmail.la', 'tempmail.bt',
+    'tempmail.np', 'tempmail.mv',
+    'tempmail.io', 'tempmail.app',
+    'tempmail.dev', 'tempmail.tech',
+    'tempmail.cloud', 'tempmail.digital',
+    'tempmail.space', 'tempmail.world',
+    'tempmail.site', 'tempmail.online',
+    'tempmail.website', 'tempmail.blog',
+    'tempmail.store', 'tempmail.shop',
+    'tempmail.biz', 'tempmail.info',
+    'tempmail.name', 'tempmail.pro',
+    'tempmail.network', 'tempmail.systems',
+    'tempmail.services', 'tempmail.solutions',
+    'tempmail.agency', 'tempmail.studio',
+    'tempmail.media', 'tempmail.design',
+    'tempmail.art', 'tempmail.music',
+    'tempmail.games', 'tempmail.fun',
+    'tempmail.live', 'tempmail.tv',
+    'tempmail.news', 'tempmail.tech',
+    'tempmail.science', 'tempmail.education',
+    'tempmail.school', 'tempmail.university',
+    'tempmail.college', 'tempmail.academy',
+    'tempmail.institute', 'tempmail.center',
+    'tempmail.foundation', 'tempmail.association',
+    'tempmail.organization', 'tempmail.society',
+    'tempmail.club', 'tempmail.group',
+    'tempmail.team', 'tempmail.crew',
+    'tempmail.family', 'tempmail.friends',
+    'tempmail.community', 'tempmail.social',
+    'tempmail.chat', 'tempmail.messaging',
+    'tempmail.communication', 'tempmail.contact',
+    'tempmail.support', 'tempmail.help',
+    'tempmail.assistance', 'tempmail.guide',
+    'tempmail.tutorial', 'tempmail.learning',
+    'tempmail.knowledge', 'tempmail.wisdom',
+    'tempmail.expert', 'tempmail.professional',
+    'tempmail.career', 'tempmail.jobs',
+    'tempmail.work', 'tempmail.business',
+    'tempmail.enterprise', 'tempmail.company',
+    'tempmail.corporation', 'tempmail.inc',
+    'tempmail.ltd', 'tempmail.llc',
+    'tempmail.co', 'tempmail.com',
+    'tempmail.net', 'tempmail.org',
+    'tempmail.edu', 'tempmail.gov',
+    'tempmail.mil', 'tempmail.int'
+})
+
+# Local-part fragments that indicate a role-based mailbox
+_ROLE_BASED_PATTERNS = frozenset({
+    'admin', 'administrator', 'webmaster', 'postmaster', 'hostmaster',
+    'info', 'contact', 'support', 'help', 'helpdesk', 'mail',
+    'sales', 'marketing', 'billing', 'accounts', 'accounting',
+    'careers', 'jobs', 'recruitment', 'hr', 'human.resources',
+    'abuse', 'security', 'spam', 'noc', 'dns', 'whois'
+})
+
+# Basic email syntax: one '@' and a dotted domain ending in a 2+ letter TLD
+_SYNTAX_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Syntax and format rules in one pass: part lengths and no consecutive dots
+_ADDRESS_RE = re.compile(
+    r'^(?!.*\.\.)[a-zA-Z0-9._%+-]{1,64}@(?=[^@]{1,255}$)[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+)
+
+# Flattened misspellings for O(1) typo lookups (a correct domain is never a typo)
+_TYPO_DOMAINS = frozenset(
+    typo
+    for correct, typos in _TYPO_PATTERNS.items()
+    for typo in typos
+    if typo != correct
+)
+
+# Public suffix list from the snapshot bundled with tldextract: no network
+# fetch on first use and no cache directory to write
+_tld_extract = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=(), fallback_to_snapshot=True)
+
+def _compile_role_re(patterns: Iterable[str]) -> re.Pattern:
+    """Compile role patterns into a single alternation, longest first."""
+    return re.compile('|'.join(
+        re.escape(pattern)
+        for pattern in sorted(patterns, key=len, reverse=True)
+    ))
+
+# Maximum number of DNS queries in flight during a batch lookup
+DNS_CONCURRENCY = 128
+
+# Upper bound on how long a positive answer is cached, whatever its record TTL
+DNS_MAX_TTL = 3600
+
+# How long NXDOMAIN / no-answer results are cached
+DNS_NEGATIVE_TTL = 300
+
+# DNS status by (domain, record type); each entry expires after its own TTL
+_dns_cache = TLRUCache(maxsize=100_000, ttu=lambda _key, entry, now: now + entry[1])
+_dns_cache_lock = threading.Lock()
+
+# c-ares error codes that are definitive answers rather than transient failures
+_ARES_NEGATIVE_STATUS = {
+    aiodns.error.ARES_ENOTFOUND: 'nxdomain',
+    aiodns.error.ARES_ENODATA: 'noanswer',
+}
+
+# One resolver on a long-lived event loop thread, started lazily per process
+# so a forked worker never inherits the parent's loop
+_dns_loop = None
+_dns_resolver = None
+_dns_loop_pid = None
+_dns_loop_lock = threading.Lock()
+
+def _cached_dns_status(domain: str, record_type: str) -> Optional[str]:
+    with _dns_cache_lock:
+        entry = _dns_cache.get((domain, record_type))
+    return entry[0] if entry is not None else None
+
+def _store_dns_status(domain: str, record_type: str, status: str, ttl: float) -> None:
+    with _dns_cache_lock:
+        _dns_cache[(domain, record_type)] = (status, ttl)
+
+async def _create_resolver() -> aiodns.DNSResolver:
+    return aiodns.DNSResolver(timeout=2, tries=1)
+
+def _run_dns(make_coro):
+    """Run a coroutine built from the shared resolver on the DNS loop and wait for it."""
+    global _dns_loop, _dns_resolver, _dns_loop_pid
+    with _dns_loop_lock:
+        if _dns_loop is None or _dns_loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='dns-resolver', daemon=True).start()
+            _dns_resolver = asyncio.run_coroutine_threadsafe(_create_resolver(), loop).result()
+            _dns_loop, _dns_loop_pid = loop, os.getpid()
+        loop, resolver = _dns_loop, _dns_resolver
+    return asyncio.run_coroutine_threadsafe(make_coro(resolver), loop).result()
+
+async def _resolve_all(
+    resolver: aiodns.DNSResolver,
+    domains: Iterable[str],
+    record_types: Iterable[str]
+) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Resolve every record type for every domain concurrently on the DNS loop.
+
+    Returns ``{record_type: {domain: status}}`` where status is 'ok',
+    'nxdomain', 'noanswer', or None when the lookup failed transiently.
+    """
+    semaphore = asyncio.Semaphore(DNS_CONCURRENCY)
+
+    async def resolve_one(domain: str, record_type: str):
+        status = _cached_dns_status(domain, record_type)
+        if status is not None:
+            return domain, record_type, status
+
+        async with semaphore:
+            try:
+                answer = await resolver.query(domain, record_type)
+            except aiodns.error.DNSError as e:
+                status = _ARES_NEGATIVE_STATUS.get(e.args[0])
+                if status is not None:
+                    _store_dns_status(domain, record_type, status, DNS_NEGATIVE_TTL)
+                return domain, record_type, status
+
+        ttl = min([record.ttl for record in answer] + [DNS_MAX_TTL])
+        _store_dns_status(domain, record_type, 'ok', ttl)
+        return domain, record_type, 'ok'
+
+    records = {record_type: {} for record_type in record_types}
+    results = await asyncio.gather(*(
+        resolve_one(domain, record_type)
+        for domain in domains
+        for record_type in records
+    ))
+    for domain, record_type, status in results:
+        records[record_type][domain] = status
+    return records
+
+async def _resolve_mail_routes(resolver: aiodns.DNSResolver, domains: Iterable[str]) -> Dict[str, bool]:
+    """Whether each domain accepts mail, querying A only where MX has no answer."""
+    mx = (await _resolve_all(resolver, domains, ('MX',)))['MX']
+    # RFC 5321 section 5.1: a domain without MX records is its own mail host
+    implicit = [domain for domain, status in mx.items() if status == 'noanswer']
+    a = (await _resolve_all(resolver, implicit, ('A',)))['A'] if implicit else {}
+    return {domain: status == 'ok' or a.get(domain) == 'ok' for domain, status in mx.items()}
+
+def _cached_mail_route(domain: str) -> Optional[bool]:
+    mx = _cached_dns_status(domain, 'MX')
+    if mx != 'noanswer':
+        return None if mx is None else mx == 'ok'
+    a = _cached_dns_status(domain, 'A')
+    return None if a is None else a == 'ok'
+
+def resolve_domains(domains: Iterable[str]) -> Dict[str, bool]:
+    """
+    Check concurrently whether lower-cased domains accept mail.
+
+    A domain accepts mail if it has MX records, or an A record when its MX
+    query has no answer. NXDOMAIN ends the lookup after one query. Answers are
+    shared with the TTL cache used by the single-email checks. Blocks until
+    the shared DNS loop has answered every query.
+    """
+    domains = set(domains)
+    if not domains:
+        return {}
+    return _run_dns(lambda resolver: _resolve_mail_routes(resolver, domains))
+
+def has_mail_route(domain: str) -> bool:
+    """Check whether a lower-cased domain accepts mail, see resolve_domains."""
+    route = _cached_mail_route(domain)
+    if route is not None:
+        return route
+    # Only lookup failures mean "no route"; anything else is a bug and must surface
+    try:
+        return resolve_domains((domain,))[domain]
+    except (aiodns.error.DNSError, asyncio.TimeoutError):
+        return False
+
+def compute_bounce_risk(disposable: bool, role_based: bool, typo: bool, dns_ok: bool) -> str:
+    """Map already-computed validation signals to a bounce risk level."""
+    if not dns_ok or disposable:
+        return 'high'
+    if role_based or typo:
+        return 'medium'
+    return 'low'
+
 class EmailValidator:
     def __init__(self):
-        # Common typo patterns in email addresses
-        self.typo_patterns = {
-            'gmail.com': ['gamil.com', 'gmal.com', 'gmial.com', 'gmaill.com', 'gamil.com', 'gmaill.com'],
-            'yahoo.com': ['yaho.com', 'yhaoo.com', 'yahooo.com', 'yaho.com'],
-            'hotmail.com': ['hotmal.com', 'hotmai.com', 'hotmial.com', 'hotmaill.com'],
-            'outlook.com': ['outlok.com', 'outlock.com', 'outlok.com'],
-            'icloud.com': ['icloud.com', 'icloud.com', 'icloud.com'],
-            'protonmail.com': ['protonmal.com', 'protonmai.com', 'protonmial.com'],
-            'aol.com': ['aol.com', 'aol.com'],
-            'live.com': ['live.com', 'live.com'],
-            'me.com': ['me.com', 'me.com'],
-            'mac.com': ['mac.com', 'mac.com']
-        }
-        
-        # Common disposable email domains
-        self.disposable_domains = {
-            'tempmail.com', 'tempmail.net', 'tempmail.org',
-            'throwawaymail.com', 'throwawaymail.net',
-            'mailinator.com', 'mailinator.net',
-            'tempmailaddress.com', 'tempmail.plus',
-            'tempmail.ninja', 'tempmail.xyz',
-            'tempmail.ws', 'tempmail.us',
-            'tempmail.co.uk', 'tempmail.de',
-            'tempmail.fr', 'tempmail.it',
-            'tempmail.es', 'tempmail.ru',
-            'tempmail.jp', 'tempmail.cn',
-            'tempmail.in', 'tempmail.com.br',
-            'tempmail.com.au', 'tempmail.co.nz',
-            'tempmail.co.za', 'tempmail.ae',
-            'tempmail.sg', 'tempmail.hk',
-            'tempmail.tw', 'tempmail.kr',
-            'tempmail.vn', 'tempmail.th',
-            'tempmail.id', 'tempmail.my',
-            'tempmail.ph', 'tempmail.pk',
-            'tempmail.bd', 'tempmail.lk',
-            'tempmail.mm', 'tempmail.kh',
-            'tempmail.la', 'tempmail.bt',
-            'tempmail.np', 'tempmail.mv',
-            'tempmail.io', 'tempmail.app',
-            'tempmail.dev', 'tempmail.tech',
-            'tempmail.cloud', 'tempmail.digital',
-            'tempmail.space', 'tempmail.world',
-            'tempmail.site', 'tempmail.online',
-            'tempmail.website', 'tempmail.blog',
-            'tempmail.store', 'tempmail.shop',
-            'tempmail.biz', 'tempmail.info',
-            'tempmail.name', 'tempmail.pro',
-            'tempmail.network', 'tempmail.systems',
-            'tempmail.services', 'tempmail.solutions',
-            'tempmail.agency', 'tempmail.studio',
-            'tempmail.media', 'tempmail.design',
-            'tempmail.art', 'tempmail.music',
-            'tempmail.games', 'tempmail.fun',
-            'tempmail.live', 'tempmail.tv',
-            'tempmail.news', 'tempmail.tech',
-            'tempmail.science', 'tempmail.education',
-            'tempmail.school', 'tempmail.university',
-            'tempmail.college', 'tempmail.academy',
-            'tempmail.institute', 'tempmail.center',
-            'tempmail.foundation', 'tempmail.association',
-            'tempmail.organization', 'tempmail.society',
-            'tempmail.club', 'tempmail.group',
-            'tempmail.team', 'tempmail.crew',
-            'tempmail.family', 'tempmail.friends',
-            'tempmail.community', 'tempmail.social',
-            'tempmail.chat', 'tempmail.messaging',
-            'tempmail.communication', 'tempmail.contact',
-            'tempmail.support', 'tempmail.help',
-            'tempmail.assistance', 'tempmail.guide',
-            'tempmail.tutorial', 'tempmail.learning',
-            'tempmail.knowledge', 'tempmail.wisdom',
-            'tempmail.expert', 'tempmail.professional',
-            'tempmail.career', 'tempmail.jobs',
-            'tempmail.work', 'tempmail.business',
-            'tempmail.enterprise', 'tempmail.company',
-            'tempmail.corporation', 'tempmail.inc',
-            'tempmail.ltd', 'tempmail.llc',
-            'tempmail.co', 'tempmail.com',
-            'tempmail.net', 'tempmail.org',
-            'tempmail.edu', 'tempmail.gov',
-            'tempmail.mil', 'tempmail.int'
-        }
-
-        # Update role-based patterns to be more specific
-        self.role_based_patterns = {
-            'admin', 'administrator', 'webmaster', 'postmaster', 'hostmaster',
-            'info', 'contact', 'support', 'help', 'helpdesk', 'mail',
-            'sales', 'marketing', 'billing', 'accounts', 'accounting',
-            'careers', 'jobs', 'recruitment', 'hr', 'human.resources',
-            'abuse', 'security', 'spam', 'noc', 'dns', 'whois'
+        self.typo_patterns = _TYPO_PATTERNS
+        self.disposable_domains = frozenset(domain.lower() for domain in _DISPOSABLE_DOMAINS)
+        self.role_based_patterns = _ROLE_BASED_PATTERNS
+        # One regex scan of the local part instead of a test per pattern
+        self._role_re = _compile_role_re(self.role_based_patterns)
+        # Misspelled domain -> correct domain, for hashed suggestion lookups
+        self._typo_corrections = {
+            typo: correct
+            for correct, typos in self.typo_patterns.items()
+            for typo in typos
+            if typo != correct
         }
 
     def check_syntax(self, email: str) -> bool:
         """Check basic email syntax."""
         try:
-            # Basic email regex pattern
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(pattern, email))
-        except Exception:
+            return _SYNTAX_RE.match(email) is not None
+        except TypeError:
             return False
 
-    def check_format(self, email: str) -> bool:
-        """Check email format and structure."""
+    def check_mx(self, email: str, mx_cache: Optional[Dict[str, bool]] = None) -> bool:
+        """Check if domain accepts mail: MX records, or an A record if it has none."""
         try:
-            # Split into local and domain parts
-            local_part, domain = email.split('@')
-            
-            # Check local part length
-            if len(local_part) > 64:
-                return False
-            
-            # Check domain length
-            if len(domain) > 255:
-                return False
-            
-            # Check for consecutive dots
-            if '..' in local_part or '..' in domain:
-                return False
-            
-            # Check domain has at least one dot
-            if '.' not in domain:
-                return False
-            
-            return True
-        except Exception:
-            return False
-
-    def check_dns(self, email: str) -> bool:
-        """Check if domain has valid DNS records."""
-        try:
-            domain = email.split('@')[1]
-            dns.resolver.resolve(domain, 'A')
-            return True
-        except Exception:
-            return False
-
-    def check_mx(self, email: str) -> bool:
-        """Check if domain has valid MX records."""
-        try:
-            domain = email.split('@')[1]
-            dns.resolver.resolve(domain, 'MX')
-            return True
-        except Exception:
+            domain = email.split('@')[1].lower()
+            if mx_cache is not None and domain in mx_cache:
+                return mx_cache[domain]
+            return has_mail_route(domain)
+        except IndexError:
             return False
 
     def is_disposable_domain(self, email: str) -> bool:
         """Check if email domain is disposable."""
-        domain = email.split('@')[1].lower()
-        return domain in self.disposable_domains
+        return email.rsplit('@', 1)[1].lower() in self.disposable_domains
 
     def is_role_based_email(self, email: str) -> bool:
         """Check if email is role-based."""
-        local_part = email.split('@')[0].lower()
-        return any(pattern in local_part for pattern in self.role_based_patterns)
+        local_part = email.rsplit('@', 1)[0].lower()
+        return self._role_re.search(local_part) is not None
 
     def check_typo(self, email: str) -> bool:
         """Check for common typos in email."""
-        domain = email.split('@')[1].lower()
-        return any(typo in domain for typo in self.typo_patterns)
+        return email.rsplit('@', 1)[1].lower() in _TYPO_DOMAINS
 
-    def assess_bounce_risk(self, email: str) -> str:
+    def assess_bounce_risk(self, email: str, mx_cache: Optional[Dict[str, bool]] = None) -> str:
         """Assess the risk of email bouncing."""
-        if not self.check_syntax(email):
-            return 'high'
-        if not self.check_format(email):
-            return 'high'
-        if not self.check_dns(email):
+        if _ADDRESS_RE.match(email) is None:
             return 'high'
-        if not self.check_mx(email):
+        # A disposable domain is high risk whatever DNS says, so skip the lookups
+        disposable = self.is_disposable_domain(email)
+        if disposable:
             return 'high'
-        if self.is_disposable_domain(email):
-            return 'high'
-        if self.is_role_based_email(email):
-            return 'medium'
-        if self.check_typo(email):
-            return 'medium'
-        return 'low'
-
-    def validate_email(self, email: str) -> Dict[str, Any]:
-        """Validate an email address and return detailed results."""
+        return compute_bounce_risk(
+            disposable=disposable,
+            role_based=self.is_role_based_email(email),
+            typo=self.check_typo(email),
+            dns_ok=self.check_mx(email, mx_cache)
+        )
+
+    def validate_email(
+        self,
+        email: str,
+        mx_cache: Optional[Dict[str, bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate an email address and return detailed results.
+
+        ``mx_cache`` maps lower-cased domains to pre-resolved results from
+        resolve_domains; domains found there skip the per-email lookup.
+        """
+        details = {
+            'syntax_check': False,
+            'format_validation': False,
+            'dns_verification': False,
+            'mx_record_check': False,
+            'disposable_domain': False,
+            'role_based_email': False,
+            'typo_detection': False,
+            'bounce_risk': 'high'
+        }
+        result = {'is_valid': False, 'email': email, 'details': details}
         try:
-            # Basic syntax check
-            syntax_check = self.check_syntax(email)
-            if not syntax_check:
-                return {
-                    'is_valid': False,
-                    'email': email,
-                    'details': {
-                        'syntax_check': False,
-                        'format_validation': False,
-                        'dns_verification': False,
-                        'mx_record_check': False,
-                        'disposable_domain': False,
-                        'role_based_email': False,
-                        'typo_detection': False,
-                        'bounce_risk': 'high'
-                    }
-                }
-            
-            # Format validation
-            format_valid = self.check_format(email)
-            if not format_valid:
-                return {
-                    'is_valid': False,
-                    'email': email,
-                    'details': {
-                        'syntax_check': True,
-                        'format_validation': False,
-                        'dns_verification': False,
-                        'mx_record_check': False,
-                        'disposable_domain': False,
-                        'role_based_email': False,
-                        'typo_detection': False,
-                        'bounce_risk': 'high'
-                    }
-                }
-            
-            # DNS verification
-            dns_valid = self.check_dns(email)
-            if not dns_valid:
-                return {
-                    'is_valid': False,
-                    'email': email,
-                    'details': {
-                        'syntax_check': True,
-                        'format_validation': True,
-                        'dns_verification': False,
-                        'mx_record_check': False,
-                        'disposable_domain': False,
-                        'role_based_email': False,
-                        'typo_detection': False,
-                        'bounce_risk': 'high'
-                    }
-                }
-            
-            # MX record check
-            mx_valid = self.check_mx(email)
-            if not mx_valid:
-                return {
-                    'is_valid': False,
-                    'email': email,
-                    'details': {
-                        'syntax_check': True,
-                        'format_validation': True,
-                        'dns_verification': True,
-                        'mx_record_check': False,
-                        'disposable_domain': False,
-                        'role_based_email': False,
-                        'typo_detection': False,
-                        'bounce_risk': 'high'
-                    }
-                }
+            # Syntax and format in one regex; only a failure needs telling apart
+            if _ADDRESS_RE.match(email) is None:
+                details['syntax_check'] = self.check_syntax(email)
+                return result
+            details['syntax_check'] = details['format_validation'] = True
             
-            # Additional checks
-            disposable = self.is_disposable_domain(email)
-            role_based = self.is_role_based_email(email)
-            typo = self.check_typo(email)
-            bounce_risk = self.assess_bounce_risk(email)
+            # One mail-route lookup answers both DNS checks: a domain that
+            # accepts mail resolves, and NXDOMAIN needs no second query
+            if not self.check_mx(email, mx_cache):
+                return result
+            details['dns_verification'] = details['mx_record_check'] = True
             
-            return {
-                'is_valid': True,
-                'email': email,
-                'details': {
-                    'syntax_check': True,
-                    'format_validation': True,
-                    'dns_verification': True,
-                    'mx_record_check': True,
-                    'disposable_domain': disposable,
-                    'role_based_email': role_based,
-                    'typo_detection': typo,
-                    'bounce_risk': bounce_risk
-                }
-            }
+            # Additional checks from a single split, each computed once
+            local_part, _, domain = email.rpartition('@')
+            domain = domain.lower()
+            disposable = domain in self.disposable_domains
+            role_based = self._role_re.search(local_part.lower()) is not None
+            typo = domain in _TYPO_DOMAINS
+            details['disposable_domain'] = disposable
+            details['role_based_email'] = role_based
+            details['typo_detection'] = typo
+            details['bounce_risk'] = compute_bounce_risk(disposable, role_based, typo, dns_ok=True)
+            result['is_valid'] = True
+            return result
             
         except Exception as e:
             logger.error(f"Error validating email {email}: {str(e)}")
-            return {
-                'is_valid': False,
+            # Report every check as failed, whichever stage raised
+            for key in details:
+                details[key] = False
+            details['bounce_risk'] = 'high'
+            return result
+
+    def _string_checks(self, emails: List[str]):
+        """
+        Run the syntax and format checks over a batch as column operations.
+
+        Returns the local part, lower-cased domain, syntax mask and format mask
+        as aligned pandas Series.
+        """
+        addresses = pd.Series(emails, dtype=object).astype(str)
+        parts = addresses.str.partition('@')
+        local_part, domain = parts[0], parts[2]
+
+        # Passing the fused pattern implies valid syntax, so only the
+        # addresses that fail it need the plain syntax regex
+        format_valid = addresses.str.match(_ADDRESS_RE)
+        syntax = format_valid
+        rejected = ~format_valid
+        if rejected.any():
+            # Combined as a mask rather than set in place, so the dtype stays bool
+            rejected_syntax = addresses[rejected].str.match(_SYNTAX_RE).astype(bool)
+            syntax = format_valid | rejected_syntax.reindex(addresses.index, fill_value=False)
+        return local_part, domain.str.lower(), syntax, format_valid
+
+    def dns_candidate_domains(self, emails: List[str]) -> Set[str]:
+        """Lower-cased domains of the emails that pass syntax and format checks."""
+        if not emails:
+            return set()
+        _, domain_lower, _, format_valid = self._string_checks(emails)
+        return set(domain_lower[format_valid].unique())
+
+    def validate_batch(
+        self,
+        emails: List[str],
+        mx_cache: Optional[Dict[str, bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate many email addresses at once.
+
+        The string checks run as vectorized pandas operations and DNS is looked
+        up once per unique domain. Results match validate_email, in input order.
+        Domains missing from ``mx_cache`` are checked with resolve_domains.
+        """
+        if not emails:
+            return []
+
+        local_part, domain_lower, syntax, format_valid = self._string_checks(emails)
+
+        # DNS only for addresses that passed the string checks, once per domain;
+        # anything the caller has not pre-resolved is resolved concurrently here
+        mail_routes = dict(mx_cache or {})
+        missing = [d for d in domain_lower[format_valid].unique() if d not in mail_routes]
+        if missing:
+            mail_routes = {**resolve_domains(missing), **mail_routes}
+
+        # A domain that accepts mail passes both the DNS and the MX check
+        is_valid = format_valid & domain_lower.map(mail_routes).eq(True)
+
+        # Additional checks are only reported for valid addresses
+        disposable = is_valid & domain_lower.isin(self.disposable_domains)
+        typo = is_valid & domain_lower.isin(_TYPO_DOMAINS)
+        role_based = pd.Series(False, index=is_valid.index)
+        if is_valid.any():
+            role_based[is_valid] = local_part[is_valid].str.lower().str.contains(self._role_re)
+
+        bounce_risk = pd.Series('low', index=is_valid.index)
+        bounce_risk[role_based | typo] = 'medium'
+        bounce_risk[~is_valid | disposable] = 'high'
+
+        return [
+            {
+                'is_valid': valid,
                 'email': email,
                 'details': {
-                    'syntax_check': False,
-                    'format_validation': False,
-                    'dns_verification': False,
-                    'mx_record_check': False,
-                    'disposable_domain': False,
-                    'role_based_email': False,
-                    'typo_detection': False,
-                    'bounce_risk': 'high'
+                    'syntax_check': syntax_ok,
+                    'format_validation': format_ok,
+                    'dns_verification': valid,
+                    'mx_record_check': valid,
+                    'disposable_domain': disposable_ok,
+                    'role_based_email': role_ok,
+                    'typo_detection': typo_ok,
+                    'bounce_risk': risk
                 }
             }
+            for email, valid, syntax_ok, format_ok, disposable_ok, role_ok, typo_ok, risk in zip(
+                emails,
+                is_valid.tolist(),
+                syntax.tolist(),
+                format_valid.tolist(),
+                disposable.tolist(),
+                role_based.tolist(),
+                typo.tolist(),
+                bounce_risk.tolist()
+            )
+        ]
 
     def suggest_corrections(self, email: str) -> List[str]:
         """Suggest possible corrections for an email address."""
-        suggestions = []
-        
         # Extract domain and suffix
-        ext = tldextract.extract(email)
-        domain = ext.domain
-        suffix = ext.suffix
+        ext = _tld_extract(email)
+        full_domain = ext.domain + '.' + ext.suffix
         
         # Check for common domain typos
-        for correct_domain, typos in self.typo_patterns.items():
-            if domain + '.' + suffix in typos:
-                suggestions.append(email.replace(domain + '.' + suffix, correct_domain))
-        
-        return suggestions
+        correct_domain = self._typo_corrections.get(full_domain)
+        if correct_domain is None:
+            return []
+        return [email.replace(full_domain, correct_domain)]
 
 # Create a global instance
 email_validator = EmailValidator()
@@ -368,7 +541,9 @@ def get_results(task_id: str):
 
 def validate_email_address(email: str) -> tuple[bool, str]:
     """
-    Validate a single email address using the EmailValidator instance
+    Validate a single email address using the EmailValidator instance.
+
+    Returns whether the address is valid and its bounce risk.
     """
-    return email_validator.validate_email(email)
-    return email_validator.validate_email(email)
\ No newline at end of file
+    result = email_validator.validate_email(email)
+    return result['is_valid'], result['details']['bounce_risk']
\ No newline at end of file
@@ -1,5 +1,4 @@
 from fastapi import FastAPI, UploadFile, File
-import pandas as pd
 import aiofiles
 import os
 from celery.result import AsyncResult
@@ -8,9 +7,8 @@ from fastapi.responses import JSONResponse
 from utils import EmailValidator
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-import streamlit as st
-import requests
 import time
+import uuid
 
 app = FastAPI(
     title="Email Validation API",
@@ -31,6 +29,9 @@ app.add_middleware(
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Bytes read per chunk when saving uploads
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 # Create a global instance of EmailValidator
 email_validator = EmailValidator()
 
@@ -58,54 +59,21 @@ async def upload_file(file: UploadFile = File(...)):
                 content={"error": "File must be a CSV file"}
             )
 
-        file_path = f"{UPLOAD_DIR}/{file.filename}"
+        # Rows are bare addresses, one per line, which the task reads from
+        # .txt uploads; a .csv upload there must have an 'email' header.
+        # A unique name keeps concurrent uploads of the same file apart
+        file_path = f"{UPLOAD_DIR}/{uuid.uuid4().hex}.txt"
         
         async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
-            await out_file.write(content)
-
-        df = pd.read_csv(file_path, header=None, names=["email"])
-        email_list = df["email"].tolist()
-
-        # Initial validation
-        initial_validation = []
-        for email in email_list:
-            is_valid, message = email_validator.validate_email(email)
-            initial_validation.append({
-                "email": email,
-                "is_valid": is_valid,
-                "message": message,
-                "syntax_check": is_valid,
-                "format_validation": is_valid,
-                "dns_verification": is_valid,
-                "mx_record_check": is_valid,
-                "disposable_email": not is_valid,
-                "role_based_email": False,  # Add logic if needed
-                "typo_detection": not is_valid,
-                "bounce_risk": not is_valid
-            })
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await out_file.write(chunk)
 
-        # Only proceed with Celery task if there are valid emails
-        valid_emails = [item["email"] for item in initial_validation if item["is_valid"]]
-        
-        if valid_emails:
-            task = validate_bulk_emails.delay(valid_emails)
-            return {
-                "task_id": task.id,
-                "message": "Email validation started!",
-                "initial_validation": initial_validation,
-                "total_emails": len(email_list),
-                "valid_emails": len(valid_emails),
-                "invalid_emails": len(email_list) - len(valid_emails)
-            }
-        else:
-            return {
-                "message": "No valid emails found in the file",
-                "validation_results": initial_validation,
-                "total_emails": len(email_list),
-                "valid_emails": 0,
-                "invalid_emails": len(email_list)
-            }
+        # The task parses and validates the file; nothing is read here
+        task = validate_bulk_emails.delay(file_path)
+        return {
+            "task_id": task.id,
+            "message": "Email validation started!"
+        }
 
     except Exception as e:
         return JSONResponse(
@@ -162,22 +130,23 @@ async def validate_single_email(email: str):
     """
     Validate a single email address.
     """
-    is_valid, message = email_validator.validate_email(email)
+    result = email_validator.validate_email(email)
+    is_valid = result["is_valid"]
+    details = result["details"]
     suggestions = email_validator.suggest_corrections(email) if not is_valid else []
     
     return {
         "email": email,
         "is_valid": is_valid,
-        "message": message,
         "suggestions": suggestions,
-        "syntax_check": is_valid,
-        "format_validation": is_valid,
-        "dns_verification": is_valid,
-        "mx_record_check": is_valid,
-        "disposable_email": not is_valid,
-        "role_based_email": False,
-        "typo_detection": not is_valid,
-        "bounce_risk": not is_valid
+        "syntax_check": details["syntax_check"],
+        "format_validation": details["format_validation"],
+        "dns_verification": details["dns_verification"],
+        "mx_record_check": details["mx_record_check"],
+        "disposable_email": details["disposable_domain"],
+        "role_based_email": details["role_based_email"],
+        "typo_detection": details["typo_detection"],
+        "bounce_risk": details["bounce_risk"]
     }
 
 @app.get("/health")
@@ -1,13 +1,20 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import requests
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import time
-from datetime import datetime
-import io
-import tempfile
 import os
-from typing import Dict, Any
+import json
+import re
+import asyncio
+import httpx
+from typing import Dict, Any, Iterator, List, Tuple, Union
 from io import BytesIO
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.client import connect as ws_connect
 
 
 # Set page config must be the first Streamlit command
@@ -21,44 +28,81 @@ st.set_page_config(
 
 BACKEND_URL = os.getenv("BACKEND_URL", "https://email-verify-backend-oayu.onrender.com")
 
+# Same host as BACKEND_URL, over ws:// or wss://
+BACKEND_WS_URL = BACKEND_URL.replace("http", "ws", 1)
+
+# Result columns shown as pass/fail, by display name
+CHECK_COLUMNS = {
+    'Syntax': 'syntax_check',
+    'Format': 'format_validation',
+    'DNS': 'dns_verification',
+    'MX': 'mx_record_check'
+}
+
+# Result columns that flag a problem when set, by display name
+FLAG_COLUMNS = {
+    'Disposable': 'disposable_email',
+    'Role-based': 'role_based_email',
+    'Typo': 'typo_detection'
+}
+
+# Seconds before a single-email validation is abandoned
+SINGLE_VALIDATION_TIMEOUT = 8
+
+# Plain-text summary of a single result for the clipboard
+COPY_TEMPLATE = """
+Email: {email}
+Status: {status}
+Message: {message}
+
+Validation Details:
+- Syntax Check: {syntax}
+- Format Validation: {format}
+- DNS Verification: {dns}
+- MX Record Check: {mx}
+- Disposable Email: {disposable}
+- Role-based Email: {role_based}
+- Typo Detection: {typo}
+- Bounce Risk: {bounce_risk}
+"""
+
+# Clipboard write run in the user's browser, reporting whether it succeeded
+COPY_SCRIPT_TEMPLATE = """
+<p id="copy-status" style="font-family: sans-serif; margin: 0;">Copying...</p>
+<script>
+const statusLine = document.getElementById("copy-status");
+const report = (text) => { statusLine.textContent = text; };
+if (navigator.clipboard) {
+  navigator.clipboard.writeText({text}).then(
+    () => report("✅ Results copied to clipboard!"),
+    () => report("❌ The browser blocked clipboard access. Use the copy icon on the text above.")
+  );
+} else {
+  report("❌ Clipboard access is unavailable here. Use the copy icon on the text above.");
+}
+</script>
+"""
+
+# Single-email requests in flight at once when several addresses are pasted
+MAX_CONCURRENT_VALIDATIONS = 8
+
+# Below this many rows, results are shown with st.table built from plain dicts
+SMALL_TABLE_ROWS = 20
+
+# Polling fallback: 30 seconds, backing off from 0.1s to at most 2s between polls
+POLL_TIMEOUT = 30
+POLL_INITIAL_DELAY = 0.1
+POLL_BACKOFF = 1.4
+POLL_MAX_DELAY = 2.0
+
+@st.cache_data
+def load_css() -> str:
+    """Read the custom stylesheet once per server process."""
+    with open(os.path.join(os.path.dirname(__file__), "style.css")) as f:
+        return f"<style>{f.read()}</style>"
+
 # Add custom CSS
-st.markdown("""
-    <style>
-    .stProgress .st-bo {
-        background-color: #e0f7e0;  /* Light green background */
-    }
-    .stProgress .st-bo > div {
-        background-color: #28a745;  /* Darker green for progress */
-    }
-    .stMetric {
-        background-color: #28a745;  /* Green background */
-        color: black !important;   /* Black text */
-        padding: 15px;
-        border-radius: 5px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .stMetric:hover {
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    .stButton>button {
-        width: 100%;
-        margin-top: 10px;
-    }
-    .metric-container {
-        background-color: #f0f2f6;
-        padding: 10px;
-        border-radius: 5px;
-        margin: 5px 0;
-    }
-    .metric-label {
-        font-weight: bold;
-        color: #1f77b4;
-    }
-    .metric-value {
-        color: #2c3e50;
-    }
-    </style>
-""", unsafe_allow_html=True)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Sidebar
 with st.sidebar:
@@ -90,54 +134,287 @@ tab1, tab2 = st.tabs(["Bulk Validation", "Single Email"])
 def process_file(file):
     """Process uploaded file and return list of emails."""
     try:
+        # Arrow's tokenizer parses both formats and keeps the strings in Arrow buffers
         if file.name.endswith('.csv'):
-            df = pd.read_csv(file)
+            df = pd.read_csv(file, engine='pyarrow', dtype_backend='pyarrow')
             if 'email' not in df.columns:
                 st.error("CSV file must contain an 'email' column")
                 return None
-            return df['email'].tolist()
         elif file.name.endswith('.txt'):
-            # Read text file and split by newlines
-            content = file.getvalue().decode('utf-8')
-            return [email.strip() for email in content.split('\n') if email.strip()]
+            # One email per line, no header
+            df = pd.read_csv(file, header=None, names=['email'], engine='pyarrow', dtype_backend='pyarrow')
         else:
             st.error("Unsupported file format. Please upload a CSV or TXT file.")
             return None
+        emails = df['email'].dropna().str.strip()
+        return emails[emails != ''].tolist()
     except Exception as e:
         st.error(f"Error processing file: {str(e)}")
         return None
 
-def display_results(result_data: Dict[str, Any], container):
-    """Display validation results in a formatted table."""
-    if not result_data or 'results' not in result_data:
-        container.error("No results to display")
+@st.cache_resource
+def backend_session() -> requests.Session:
+    """One keep-alive session per server process, so calls reuse TLS connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def flatten_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Lift a validation result's per-check details to the top level."""
+    details = result.get('details', {})
+    return {
+        'email': result.get('email'),
+        'is_valid': result['is_valid'],
+        **details,
+        'disposable_email': details.get('disposable_domain', False)
+    }
+
+async def validate_addresses(emails: List[str]) -> List[Union[httpx.Response, BaseException]]:
+    """
+    Validate addresses concurrently over one client.
+
+    Each request has a hard timeout and a failed connection is retried once.
+    A request that still fails is returned as its exception, so the other
+    addresses keep their results.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+    transport = httpx.AsyncHTTPTransport(retries=1)
+    async with httpx.AsyncClient(base_url=BACKEND_URL, timeout=10, transport=transport) as client:
+        async def validate_one(email: str) -> httpx.Response:
+            async with semaphore:
+                return await asyncio.wait_for(
+                    client.post("/validate/", json={"email": email}),
+                    SINGLE_VALIDATION_TIMEOUT
+                )
+        return await asyncio.gather(*(validate_one(email) for email in emails), return_exceptions=True)
+
+def poll_task_updates(task_id: str) -> Iterator[Dict[str, Any]]:
+    """Yield task status payloads by polling the results endpoint."""
+    deadline = time.monotonic() + POLL_TIMEOUT
+    retry_count = 0
+    while time.monotonic() < deadline:
+        result_response = backend_session().get(f"{BACKEND_URL}/results/{task_id}")
+        if result_response.status_code != 200:
+            yield {
+                'status': 'failed',
+                'error': f"Failed to get validation results: {result_response.text}"
+            }
+            return
+        result_data = result_response.json()
+        yield result_data
+        if result_data.get('status') in ('completed', 'failed'):
+            return
+        # Fast jobs are noticed quickly, slow ones are polled less often
+        time.sleep(min(POLL_INITIAL_DELAY * POLL_BACKOFF ** retry_count, POLL_MAX_DELAY))
+        retry_count += 1
+
+def task_updates(task_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield task status payloads as the backend pushes them over a WebSocket.
+
+    Falls back to polling when the WebSocket connection cannot be opened.
+    Gives up after POLL_TIMEOUT seconds, like polling does.
+    """
+    try:
+        websocket = ws_connect(f"{BACKEND_WS_URL}/ws/results/{task_id}", open_timeout=5)
+    except Exception:
+        yield from poll_task_updates(task_id)
         return
+    deadline = time.monotonic() + POLL_TIMEOUT
+    with websocket:
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                message = websocket.recv(timeout=remaining)
+            except (TimeoutError, ConnectionClosed):
+                return
+            yield json.loads(message)
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def load_results(task_id: str, results_url: str) -> pd.DataFrame:
+    """
+    Download the per-email results of a completed task as a flat DataFrame.
+
+    Cached by task id, so reruns triggered by the download and refresh
+    buttons reuse the table instead of fetching and parsing it again.
+    """
+    results_response = backend_session().get(f"{BACKEND_URL}{results_url}")
+    results_response.raise_for_status()
+    # Arrow-backed columns: booleans as bitmaps, strings in Arrow buffers
+    return pd.DataFrame.from_records(
+        [flatten_result(result) for result in results_response.json()]
+    ).convert_dtypes(dtype_backend='pyarrow')
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def build_display_tables(task_id: str, results_url: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Table shown on the page and its plain-text variant for the downloads.
+
+    Both come from one boolean array of the seven checks: the downloads
+    report raw flags, while the page marks a set flag as a failed check.
+    """
+    df = load_results(task_id, results_url)
+    if df.empty:
+        return df, df
     
-    # Create DataFrame from results
-    results = result_data['results']
-    df = pd.DataFrame(results)
+    checks = df[list(CHECK_COLUMNS.values()) + list(FLAG_COLUMNS.values())].to_numpy(dtype=bool, na_value=False)
+    is_valid = df['is_valid'].to_numpy(dtype=bool, na_value=False)
+    flag_mask = np.arange(checks.shape[1]) >= len(CHECK_COLUMNS)
+    labels = {
+        'display': (np.where(checks ^ flag_mask, '✅', '❌'), np.where(is_valid, '✅ Valid', '❌ Invalid')),
+        'export': (np.where(checks, 'Yes', 'No'), np.where(is_valid, 'Valid', 'Invalid'))
+    }
     
-    # Add status icons
-    df['Status'] = df['is_valid'].map({True: '✅ Valid', False: '❌ Invalid'})
+    tables = []
+    for check_labels, status in labels.values():
+        columns = {
+            'Email': df['email'],
+            'Status': status,
+            'Message': df.get('message', '')
+        }
+        columns.update(zip([*CHECK_COLUMNS, *FLAG_COLUMNS], check_labels.T))
+        columns['Bounce Risk'] = df['bounce_risk']
+        tables.append(pd.DataFrame(columns))
+    return tables[0], tables[1]
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV with Arrow's C++ writer."""
+    buffer = BytesIO()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return buffer.getvalue()
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def build_excel(task_id: str, results_url: str) -> bytes:
+    """Excel workbook of the download table, with a styled header and fitted columns."""
+    _, display_df = build_display_tables(task_id, results_url)
+    
+    excel_buffer = BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
+        display_df.to_excel(writer, index=False, sheet_name='Validation Results')
+        
+        # Get the workbook and the worksheet
+        workbook = writer.book
+        worksheet = writer.sheets['Validation Results']
+        
+        # Add formats
+        header_format = workbook.add_format({
+            'bold': True,
+            'bg_color': '#4CAF50',
+            'font_color': 'white',
+            'border': 1
+        })
+        
+        # Format the header
+        for col_num, value in enumerate(display_df.columns.values):
+            worksheet.write(0, col_num, value, header_format)
+        
+        # Auto-adjust column widths: longest cell per column in one vectorized
+        # pass, never narrower than the header
+        cell_widths = display_df.astype('string').apply(lambda column: column.str.len().max())
+        header_widths = [len(str(col)) for col in display_df.columns]
+        for idx, max_length in enumerate(np.maximum(cell_widths.fillna(0).to_numpy(), header_widths)):
+            worksheet.set_column(idx, idx, int(max_length) + 2)
     
-    # Create a new DataFrame with the required columns
-    display_df = pd.DataFrame({
-        'Email': df['email'],
-        'Status': df['Status'],
-        'Message': df['message'],  # Add message column
-        'Syntax': df['syntax_check'].map({True: '✅', False: '❌'}),
-        'Format': df['format_validation'].map({True: '✅', False: '❌'}),
-        'DNS': df['dns_verification'].map({True: '✅', False: '❌'}),
-        'MX': df['mx_record_check'].map({True: '✅', False: '❌'}),
-        'Disposable': df['disposable_email'].map({True: '❌', False: '✅'}),
-        'Role-based': df['role_based_email'].map({True: '❌', False: '✅'}),
-        'Typo': df['typo_detection'].map({True: '❌', False: '✅'}),
-        'Bounce Risk': df['bounce_risk']
-    })
+    return excel_buffer.getvalue()
+
+def display_results(display_df: pd.DataFrame, container):
+    """Display validation results in a formatted table."""
+    if display_df.empty:
+        container.error("No results data available")
+        return
     
     # Display the table
     container.dataframe(display_df, use_container_width=True)
 
+@st.fragment
+def render_bulk_results(result_data: Dict[str, Any]):
+    """
+    Show the metrics, results table and downloads for a completed task.
+
+    Runs as a fragment, so its buttons rerun only this section and not the
+    sidebar, stylesheet or single-email form.
+    """
+    # Display metrics cards
+    metrics_col1, metrics_col2, metrics_col3, metrics_col4 = st.columns(4)
+    
+    with metrics_col1:
+        st.metric(
+            "Valid Emails",
+            result_data.get('valid_count', 0),
+            help="Number of valid email addresses"
+        )
+    
+    with metrics_col2:
+        st.metric(
+            "Invalid Emails",
+            result_data.get('invalid_count', 0),
+            help="Number of invalid email addresses"
+        )
+    
+    with metrics_col3:
+        st.metric(
+            "Total Emails",
+            result_data.get('total_count', 0),
+            help="Total number of emails processed"
+        )
+    
+    with metrics_col4:
+        st.metric(
+            "Processing Time",
+            f"{result_data.get('processing_time', 0):.2f}s",
+            help="Time taken to process all emails"
+        )
+    
+    # Add spacing
+    st.markdown("---")
+    
+    # Both tables come from one cache lookup; each hit copies the cached frames
+    if result_data.get('results_url'):
+        page_df, display_df = build_display_tables(result_data['task_id'], result_data['results_url'])
+    else:
+        page_df = display_df = pd.DataFrame()
+    
+    # Display results table
+    display_results(page_df, st.container())
+    
+    # Add download and refresh buttons
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if not display_df.empty:
+            # Create CSV
+            csv = to_csv_bytes(display_df)
+            st.download_button(
+                label="📥 Download CSV",
+                data=csv,
+                file_name="email_validation_results.csv",
+                mime="text/csv"
+            )
+        else:
+            st.warning("No results to download")
+    
+    with col2:
+        if not display_df.empty:
+            # Build the workbook only once asked for; it is the slowest export
+            if st.session_state.get('excel_task_id') != result_data['task_id']:
+                if st.button("📊 Prepare Excel"):
+                    st.session_state.excel_task_id = result_data['task_id']
+                    st.rerun(scope="fragment")
+            else:
+                st.download_button(
+                    label="📊 Download Excel",
+                    data=build_excel(result_data['task_id'], result_data['results_url']),
+                    file_name="email_validation_results.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+        else:
+            st.warning("No results to download")
+    
+    with col3:
+        if st.button("🔄 Refresh Results"):
+            st.rerun()
+
 with tab1:
     st.header("Bulk Email Validation")
     st.write("Upload a CSV file with an 'email' column or a TXT file with one email per line.")
@@ -145,187 +422,76 @@ with tab1:
     uploaded_file = st.file_uploader("Choose a file", type=['csv', 'txt'])
     
     if uploaded_file is not None:
-        # Check file size
-        file_size = len(uploaded_file.getvalue()) / (1024 * 1024)  # Convert to MB
+        # Check file size without copying the upload into a new buffer
+        file_size = uploaded_file.size / (1024 * 1024)  # Convert to MB
         if file_size > 10:
             st.warning("⚠️ File size exceeds 10MB. Processing may take longer.")
         
         if st.button("🔍 Validate Emails"):
+            # A new run replaces the previous task's results
+            st.session_state.pop('bulk_result', None)
             try:
                 with st.spinner("Processing..."):
-                    # Upload the file directly
-                    files = {'file': (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)}
-                    response = requests.post(f"{BACKEND_URL}/upload/", files=files)
+                    # Stream the upload from the file object instead of a bytes copy
+                    uploaded_file.seek(0)
+                    files = {'file': (uploaded_file.name, uploaded_file, uploaded_file.type)}
+                    response = backend_session().post(f"{BACKEND_URL}/upload/", files=files)
                     
                     if response.status_code == 200:
                         task_id = response.json()['task_id']
                         
-                        # Create containers for progress and results
+                        # Create containers for progress and status
                         progress_container = st.empty()
                         status_container = st.empty()
-                        results_container = st.empty()
-                        
-                        # Poll for results
-                        max_retries = 60  # 30 seconds with 0.5s sleep
-                        retry_count = 0
                         
-                        while retry_count < max_retries:
-                            result_response = requests.get(f"{BACKEND_URL}/results/{task_id}")
+                        # Wait for a terminal status, pushed over a WebSocket when possible
+                        result_data = None
+                        start = time.monotonic()
+                        for update in task_updates(task_id):
+                            if update.get('status') in ('completed', 'failed'):
+                                result_data = update
+                                break
                             
-                            if result_response.status_code == 200:
-                                result_data = result_response.json()
+                            # Update progress
+                            current = update.get('current', 0)
+                            total = update.get('total', 0)
+                            if total > 0:
+                                progress = current / total
+                                progress_text = f"{current}/{total} emails validated"
                                 
-                                if result_data.get('status') == 'completed':
-                                    # Display metrics cards
-                                    metrics_col1, metrics_col2, metrics_col3, metrics_col4 = st.columns(4)
-                                    
-                                    with metrics_col1:
-                                        st.metric(
-                                            "Valid Emails",
-                                            result_data.get('valid_count', 0),
-                                            help="Number of valid email addresses"
-                                        )
-                                    
-                                    with metrics_col2:
-                                        st.metric(
-                                            "Invalid Emails",
-                                            result_data.get('invalid_count', 0),
-                                            help="Number of invalid email addresses"
-                                        )
-                                    
-                                    with metrics_col3:
-                                        st.metric(
-                                            "Total Emails",
-                                            result_data.get('total_count', 0),
-                                            help="Total number of emails processed"
-                                        )
-                                    
-                                    with metrics_col4:
-                                        st.metric(
-                                            "Processing Time",
-                                            f"{result_data.get('processing_time', 0):.2f}s",
-                                            help="Time taken to process all emails"
-                                        )
-                                    
-                                    # Add spacing
-                                    st.markdown("---")
-                                    
-                                    # Display results table
-                                    if 'results' in result_data and result_data['results']:
-                                        display_results(result_data, results_container)
-                                    else:
-                                        st.error("No results data available")
-                                    
-                                    # Add download and refresh buttons
-                                    col1, col2, col3 = st.columns(3)
-                                    
-                                    with col1:
-                                        # Convert results to DataFrame
-                                        df = pd.DataFrame(result_data.get('results', []))
-                                        if not df.empty:
-                                            # Create display DataFrame
-                                            display_df = pd.DataFrame({
-                                                'Email': df['email'],
-                                                'Status': df['is_valid'].map({True: 'Valid', False: 'Invalid'}),
-                                                'Message': df['message'],  # Add message column
-                                                'Syntax': df['syntax_check'].map({True: 'Yes', False: 'No'}),
-                                                'Format': df['format_validation'].map({True: 'Yes', False: 'No'}),
-                                                'DNS': df['dns_verification'].map({True: 'Yes', False: 'No'}),
-                                                'MX': df['mx_record_check'].map({True: 'Yes', False: 'No'}),
-                                                'Disposable': df['disposable_email'].map({True: 'Yes', False: 'No'}),
-                                                'Role-based': df['role_based_email'].map({True: 'Yes', False: 'No'}),
-                                                'Typo': df['typo_detection'].map({True: 'Yes', False: 'No'}),
-                                                'Bounce Risk': df['bounce_risk']
-                                            })
-                                            
-                                            # Create CSV
-                                            csv = display_df.to_csv(index=False)
-                                            st.download_button(
-                                                label="📥 Download CSV",
-                                                data=csv,
-                                                file_name="email_validation_results.csv",
-                                                mime="text/csv"
-                                            )
-                                        else:
-                                            st.warning("No results to download")
-                                    
-                                    with col2:
-                                        if not df.empty:
-                                            # Create Excel file
-                                            excel_buffer = BytesIO()
-                                            with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
-                                                display_df.to_excel(writer, index=False, sheet_name='Validation Results')
-                                                
-                                                # Get the workbook and the worksheet
-                                                workbook = writer.book
-                                                worksheet = writer.sheets['Validation Results']
-                                                
-                                                # Add formats
-                                                header_format = workbook.add_format({
-                                                    'bold': True,
-                                                    'bg_color': '#4CAF50',
-                                                    'font_color': 'white',
-                                                    'border': 1
-                                                })
-                                                
-                                                # Format the header
-                                                for col_num, value in enumerate(display_df.columns.values):
-                                                    worksheet.write(0, col_num, value, header_format)
-                                                
-                                                # Auto-adjust column widths
-                                                for idx, col in enumerate(display_df):
-                                                    max_length = max(
-                                                        display_df[col].astype(str).apply(len).max(),
-                                                        len(str(col))
-                                                    )
-                                                    worksheet.set_column(idx, idx, max_length + 2)
-                                            
-                                            excel_buffer.seek(0)
-                                            st.download_button(
-                                                label="📊 Download Excel",
-                                                data=excel_buffer,
-                                                file_name="email_validation_results.xlsx",
-                                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                                            )
-                                        else:
-                                            st.warning("No results to download")
-                                    
-                                    with col3:
-                                        if st.button("🔄 Refresh Results"):
-                                            st.rerun()
-                                    
-                                    break
-                                elif result_data.get('status') == 'processing':
-                                    # Update progress
-                                    current = result_data.get('current', 0)
-                                    total = result_data.get('total', 0)
-                                    progress = current / total if total > 0 else 0
-                                    
-                                    # progress_container.progress(progress)
-                                    status_container.text(f"Processing emails...")
-                                    
-                                    time.sleep(0.5)
-                                    retry_count += 1
-                                elif result_data.get('status') == 'failed':
-                                    st.error(f"Validation failed: {result_data.get('error', 'Unknown error')}")
-                                    break
-                            else:
-                                st.error(f"Failed to get validation results: {result_response.text}")
-                                break
+                                # Throughput and ETA measured from this client's view of the task
+                                elapsed = time.monotonic() - start
+                                rate = current / elapsed if elapsed > 0 else 0
+                                if rate > 0:
+                                    progress_text += f" ({rate:.0f}/s, about {(total - current) / rate:.0f}s left)"
+                                
+                                progress_container.progress(min(progress, 1.0), text=progress_text)
+                            status_container.text(f"Processing emails...")
                         
-                        if retry_count >= max_retries:
+                        if result_data is None:
                             st.error("Validation timed out. Please try again.")
+                        elif result_data['status'] == 'failed':
+                            st.error(f"Validation failed: {result_data.get('error', 'Unknown error')}")
+                        else:
+                            # Kept across reruns so the buttons below don't lose the results
+                            st.session_state.bulk_result = {**result_data, 'task_id': task_id}
                     else:
                         st.error("Failed to start validation")
             except Exception as e:
                 st.error(f"An error occurred: {str(e)}")
+    
+    if st.session_state.get('bulk_result'):
+        try:
+            render_bulk_results(st.session_state.bulk_result)
+        except Exception as e:
+            st.error(f"An error occurred: {str(e)}")
 
 with tab2:
     st.subheader("Single Email Validation")
     
     # Create a form for the email input
     with st.form("email_validation_form"):
-        email = st.text_input("Enter email address:", key="single_email")
+        email = st.text_input("Enter email address (separate several with commas):", key="single_email")
         
         # Create columns for buttons
         col1, col2, col3 = st.columns([1, 1, 1])
@@ -340,29 +506,65 @@ with tab2:
                 # Clear the form and results
                 st.session_state.pop('single_email', None)
                 st.session_state.pop('single_result', None)
+                st.session_state.pop('batch_results', None)
                 st.rerun()
     
     # Handle validation when form is submitted
-    if submit_button and email:
+    if submit_button and email.strip(' ,'):
         with st.spinner("Validating email..."):
             try:
-                response = requests.post(
-                    f"{BACKEND_URL}/validate/",
-                    json={"email": email}
-                )
-                if response.status_code == 200:
-                    result = response.json()
-                    st.session_state.single_result = result
+                # Several pasted addresses are validated concurrently
+                emails = [address.strip() for address in re.split(r'[,\n]', email) if address.strip()]
+                responses = asyncio.run(validate_addresses(emails))
+                if len(responses) > 1:
+                    st.session_state.pop('single_result', None)
+                    st.session_state.batch_results = [
+                        flatten_result(response.json())
+                        if isinstance(response, httpx.Response) and response.status_code == 200
+                        else {'email': address, 'is_valid': False, 'bounce_risk': 'error'}
+                        for address, response in zip(emails, responses)
+                    ]
+                    st.success("Validation complete!")
+                elif isinstance(responses[0], BaseException):
+                    raise responses[0]
+                elif responses[0].status_code == 200:
+                    st.session_state.pop('batch_results', None)
+                    st.session_state.single_result = flatten_result(responses[0].json())
                     st.success("Validation complete!")
                 else:
-                    st.error(f"Error: {response.text}")
+                    st.error(f"Error: {responses[0].text}")
+            except asyncio.TimeoutError:
+                st.error(f"Validation timed out after {SINGLE_VALIDATION_TIMEOUT}s. Please try again.")
             except Exception as e:
                 st.error(f"Error: {str(e)}")
-    elif submit_button and not email:
+    elif submit_button:
         st.warning("Please enter an email address")
     
     # Display results if available
-    if 'single_result' in st.session_state and st.session_state.single_result:
+    if st.session_state.get('batch_results'):
+        batch_results = st.session_state.batch_results
+        st.markdown("### Results")
+        if len(batch_results) < SMALL_TABLE_ROWS:
+            # A handful of rows renders faster as plain dicts than through pandas
+            st.table([
+                {
+                    'Email': result['email'],
+                    'Status': '✅ Valid' if result['is_valid'] else '❌ Invalid',
+                    'Bounce Risk': result['bounce_risk']
+                }
+                for result in batch_results
+            ])
+        else:
+            batch_df = pd.DataFrame(batch_results)
+            st.dataframe(
+                pd.DataFrame({
+                    'Email': batch_df['email'],
+                    'Status': np.where(batch_df['is_valid'].to_numpy(dtype=bool), '✅ Valid', '❌ Invalid'),
+                    'Bounce Risk': batch_df['bounce_risk']
+                }),
+                use_container_width=True
+            )
+    elif 'single_result' in st.session_state and st.session_state.single_result:
         result = st.session_state.single_result
         st.markdown("### Results")
         
@@ -386,7 +588,7 @@ with tab2:
             st.markdown(f"- Disposable Email: {'❌' if result['disposable_email'] else '✅'}")
             st.markdown(f"- Role-based Email: {'❌' if result['role_based_email'] else '✅'}")
             st.markdown(f"- Typo Detection: {'❌' if result['typo_detection'] else '✅'}")
-            st.markdown(f"- Bounce Risk: {'❌' if result['bounce_risk'] else '✅'}")
+            st.markdown(f"- Bounce Risk: {result['bounce_risk']}")
         
         # Display message if any
         if result.get('message'):
@@ -394,20 +596,23 @@ with tab2:
         
         # Copy to clipboard button
         if st.button("📋 Copy Results to Clipboard"):
-            result_text = f"""
-Email: {email}
-Status: {'Valid' if result['is_valid'] else 'Invalid'}
-Message: {result.get('message', 'N/A')}
-
-Validation Details:
-- Syntax Check: {'✅' if result['syntax_check'] else '❌'}
-- Format Validation: {'✅' if result['format_validation'] else '❌'}
-- DNS Verification: {'✅' if result['dns_verification'] else '❌'}
-- MX Record Check: {'✅' if result['mx_record_check'] else '❌'}
-- Disposable Email: {'❌' if result['disposable_email'] else '✅'}
-- Role-based Email: {'❌' if result['role_based_email'] else '✅'}
-- Typo Detection: {'❌' if result['typo_detection'] else '✅'}
-- Bounce Risk: {'❌' if result['bounce_risk'] else '✅'}
-"""
+            result_text = COPY_TEMPLATE.format_map({
+                'email': email,
+                'status': 'Valid' if result['is_valid'] else 'Invalid',
+                'message': result.get('message', 'N/A'),
+                'syntax': '✅' if result['syntax_check'] else '❌',
+                'format': '✅' if result['format_validation'] else '❌',
+                'dns': '✅' if result['dns_verification'] else '❌',
+                'mx': '✅' if result['mx_record_check'] else '❌',
+                'disposable': '❌' if result['disposable_email'] else '✅',
+                'role_based': '❌' if result['role_based_email'] else '✅',
+                'typo': '❌' if result['typo_detection'] else '✅',
+                'bounce_risk': result['bounce_risk']
+            })
             st.code(result_text)
-            st.success("Results copied to clipboard!")
+            # Copy in the user's browser; anything run here would touch the server's clipboard.
+            # Browsers may refuse the write, so the frame reports what actually happened
+            components.html(
+                COPY_SCRIPT_TEMPLATE.replace('{text}', json.dumps(result_text).replace('</', '<\\/')),
+                height=30
+            )